@@ -17,8 +17,9 @@ class JSONEncoder(json.JSONEncoder):
 
 
 # Serialization: https://stackoverflow.com/questions/5160077/encoding-nested-python-object-in-json
-opinions_dir = Path("data/main/annotated")
-opinions = [inception_tsv.process_opinion_file(opinion_path, opinion_path.name)
-            for opinion_path in sorted(opinions_dir.glob("*.tsv"), key=lambda path: path.name)]
-with open("corpus/corpus.json", "w", encoding="utf-8") as f:
-    json.dump(opinions, f, cls=JSONEncoder)
+if __name__ == "__main__":
+    opinions_dir = Path("data/main/annotated")
+    opinion_paths = sorted(opinions_dir.glob("*.tsv"), key=lambda path: path.name)
+    opinions = inception_tsv.process_opinion_files(opinion_paths)
+    with open("corpus/corpus.json", "w", encoding="utf-8") as f:
+        json.dump(opinions, f, cls=JSONEncoder)
@@ -0,0 +1,90 @@
+"""NumPy-backed columnar (structure-of-arrays) views of documents."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from curiam.document import Document, Sentence
+
+# Structured-array mirror of `Annotation`
+ANNOTATION_DTYPE = np.dtype([("category", object),
+                             ("start", np.int32),
+                             ("end", np.int32)])
+
+
+@dataclass(slots=True)
+class ColumnarDocument:
+    """A columnar view of a `Document` for array-based analytics.
+
+    The token arrays are aligned: entry i of `sentence_ids`, `token_ids`,
+    and `texts` describes the i-th token of the document in reading order.
+    Annotations are exploded into their own aligned arrays with one entry
+    per (token, annotation) pair.
+
+    Attributes:
+        name: The name of the source `Document`.
+        sentence_ids: The sentence id of each token.
+        token_ids: The within-sentence id of each token.
+        texts: The string of each token.
+        annotation_token_indexes: For each token-annotation, the index into
+          the token arrays of the token it belongs to.
+        annotation_ids: The id of each token-annotation (-1 for single-token
+          annotations, as in `TokenAnnotation`).
+        annotation_categories: The category of each token-annotation.
+    """
+    name: str
+    sentence_ids: np.ndarray
+    token_ids: np.ndarray
+    texts: np.ndarray
+    annotation_token_indexes: np.ndarray
+    annotation_ids: np.ndarray
+    annotation_categories: np.ndarray
+
+    @classmethod
+    def from_document(cls, document: Document) -> "ColumnarDocument":
+        """Flattens a `Document` into aligned NumPy arrays."""
+        sentence_ids = []
+        token_ids = []
+        texts = []
+        annotation_token_indexes = []
+        annotation_ids = []
+        annotation_categories = []
+        for sentence in document:
+            for token in sentence:
+                token_index = len(texts)
+                sentence_ids.append(sentence.id)
+                token_ids.append(token.id)
+                texts.append(token.text)
+                if token.annotations is None:
+                    continue
+                for token_annotation in token.annotations:
+                    annotation_token_indexes.append(token_index)
+                    annotation_ids.append(token_annotation.id)
+                    annotation_categories.append(token_annotation.category)
+        return cls(name=document.name,
+                   sentence_ids=np.asarray(sentence_ids, dtype=np.int32),
+                   token_ids=np.asarray(token_ids, dtype=np.int32),
+                   texts=np.asarray(texts, dtype=object),
+                   annotation_token_indexes=np.asarray(annotation_token_indexes,
+                                                       dtype=np.int32),
+                   annotation_ids=np.asarray(annotation_ids, dtype=np.int32),
+                   annotation_categories=np.asarray(annotation_categories,
+                                                    dtype=object))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+def sentence_annotation_array(sentence: Sentence) -> np.ndarray:
+    """Returns a sentence's annotations as a structured array.
+
+    The array's category/start/end fields mirror `Annotation`, so span
+    lengths and per-category counts can be computed with vectorized
+    operations across many annotations at once. `Sentence.get_annotations`
+    remains the object-level API.
+    """
+    annotations = sentence.get_annotations()
+    array = np.empty(len(annotations), dtype=ANNOTATION_DTYPE)
+    for i, annotation in enumerate(annotations):
+        array[i] = (annotation.category, annotation.start, annotation.end)
+    return array
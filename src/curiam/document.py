@@ -4,7 +4,7 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenAnnotation:
     """An annotation for a single token.
 
@@ -21,7 +21,7 @@ class TokenAnnotation:
         return dict(id=self.id, category=self.category)
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation:
     """An annotation described in terms of its starting and end indexes.
 
@@ -38,7 +38,7 @@ class Annotation:
     end: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Representation of a token.
 
@@ -52,13 +52,9 @@ class Token:
     annotations: list[TokenAnnotation] = None
 
     def get_categories(self) -> set[str]:
-        categories = set()
         if self.annotations is None:
             return set()
-        else:
-            for token_annotation in self.annotations:
-                categories.add(token_annotation.category)
-            return categories
+        return {token_annotation.category for token_annotation in self.annotations}
 
     def to_json(self) -> dict:
         result = dict(id=self.id, text=self.text)
@@ -67,7 +63,7 @@ class Token:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Sentence:
     """Representation of a sentence.
 
@@ -77,9 +73,12 @@ class Sentence:
     """
     id: int = None
     tokens: list[Token] = field(default_factory=list)
+    _cached_annotations: list[Annotation] = field(default=None, init=False,
+                                                  repr=False, compare=False)
 
     def append(self, token: Token):
         self.tokens.append(token)
+        self._cached_annotations = None
 
     def __iter__(self) -> Iterator[Token]:
         return iter(self.tokens)
@@ -100,33 +99,62 @@ class Sentence:
         """Reads `TokenAnnotations` from each token and returns a list of `Annotation`s.
 
         Allows for analyis of annotations at a sentence level.
+
+        The result is cached; appending a token invalidates the cache.
         """
 
+        if self._cached_annotations is not None:
+            return self._cached_annotations
+
+        max_id = -1
+        for token in self.tokens:
+            if token.annotations is None:
+                continue
+            for token_annotation in token.annotations:
+                if token_annotation.id > max_id:
+                    max_id = token_annotation.id
+
+        # Annotation ids are small dense ints, so parallel arrays indexed by id
+        # are cheaper than a dict of partially-built `Annotation`s.
+        starts = [-1] * (max_id + 1)
+        ends = [-1] * (max_id + 1)
+        categories = [None] * (max_id + 1)
         annotations = []
-        indexed_annotations = {}
         for token in self.tokens:
             if token.annotations is None:
                 continue
             for token_annotation in token.annotations:
-                if token_annotation.id == -1:  # Single-token annotation
+                annotation_id = token_annotation.id
+                if annotation_id == -1:  # Single-token annotation
                     annotations.append(Annotation(category=token_annotation.category,
                                                   start=token.id,
                                                   end=token.id))
+                elif starts[annotation_id] == -1:
+                    starts[annotation_id] = token.id
+                    ends[annotation_id] = token.id
+                    categories[annotation_id] = token_annotation.category
                 else:
-                    if token_annotation.id not in indexed_annotations.keys():
-                        annotation = Annotation(token_annotation.category,
-                                                start=token.id,
-                                                end=token.id)
-                        indexed_annotations[token_annotation.id] = annotation
-                    else:
-                        # Update the annotation's end index the next time it's seen
-                        indexed_annotations[token_annotation.id].end = token.id
-        for annotation in indexed_annotations.values():
-            annotations.append(annotation)
+                    # Update the annotation's end index the next time it's seen
+                    ends[annotation_id] = token.id
+        for category, start, end in zip(categories, starts, ends):
+            if start != -1:
+                annotations.append(Annotation(category=category, start=start, end=end))
+        self._cached_annotations = annotations
         return annotations
 
+    def get_annotations_by_category(self) -> dict[str, list[Annotation]]:
+        """Returns the sentence's `Annotation`s grouped by category.
+
+        Built from the cached result of `get_annotations`, so repeated
+        per-category lookups don't rescan the tokens.
+        """
+        by_category = {}
+        for annotation in self.get_annotations():
+            by_category.setdefault(annotation.category, []).append(annotation)
+        return by_category
+
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Representation of a document.
 
@@ -47,17 +47,18 @@ def parse_opinion_html(opinion_html: str):
                 print("error", paragraph.name)
                 print(paragraph)
                 print(contents)
-        full_string = ""
+        # Collect fragments and join once to avoid quadratic string copies
+        fragments = []
         for piece in paragraph.contents:
             if isinstance(piece, str):
                 if re.fullmatch("[\n\\s]*", piece):
                     continue
                 else:
                     piece.replace("\n", "")
-                    full_string += re.sub("\\s+", " ", piece).lstrip()
+                    fragments.append(re.sub("\\s+", " ", piece).lstrip())
             elif piece.name in ["em", "strong", "s", "sup"]:
                 piece.text.replace("\n", "")
-                full_string += re.sub("\\s+", " ", piece.text).lstrip()
+                fragments.append(re.sub("\\s+", " ", piece.text).lstrip())
             elif piece.name == "a" and "footnotemark" in piece.attrs["class"]:
                 continue
             elif piece.name == "a" and "page-label" in piece.attrs["class"]:
@@ -67,13 +68,13 @@ def parse_opinion_html(opinion_html: str):
             elif piece.name == "a" and "citation" in piece.attrs["class"]:
                 piece.text.replace("\n", "")
                 cleaned_text = re.sub("\\s+", " ", piece.text).lstrip()
-                full_string += cleaned_text
+                fragments.append(cleaned_text)
             else:
                 print(piece.name, piece.attrs)
                 print(piece.text)
                 print(paragraph)
                 raise Exception
-        paragraphs.append(full_string)
+        paragraphs.append("".join(fragments))
     return paragraphs
 
 
@@ -1,10 +1,19 @@
 """Functions for processing the TSV-formatted data exported from Inception."""
 
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
 from curiam.document import Document, Sentence, Token, TokenAnnotation
 
+# A sublabel is a category optionally followed by an index in square brackets
+SUBLABEL_PATTERN = re.compile(r"([^|]+?)(?:\[(\d+)\])?(?:\||$)")
+
+# Just the bracketed index of an indexed annotation
+INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+
 
 def split_complex_label(complex_label: str) -> Tuple[list[str], list[str]]:
     """Splits a complex token label into categories and token indexes.
@@ -26,93 +35,162 @@ def split_complex_label(complex_label: str) -> Tuple[list[str], list[str]]:
         A list of categories and a list of corresponding indexes.
     """
 
-    sublabels = complex_label.split("|")
+    if "|" not in complex_label:
+        # Common case: a single sublabel doesn't need the regex machinery
+        bracket_index = complex_label.find("[")
+        if bracket_index == -1:
+            return [sys.intern(complex_label)], [-1]
+        return ([sys.intern(complex_label[:bracket_index])],
+                [int(complex_label[bracket_index + 1:-1])])
+
     categories = []
     annotation_indexes = []
-    for sublabel in sublabels:
-        if "[" not in sublabel:
-            categories.append(sublabel)
-            annotation_indexes.append(-1)
-        else:
-            # Remove the close bracket and then split on the open bracket
-            sublabel = sublabel.replace("]", "")
-            category, annotation_index = sublabel.split("[")
-            annotation_index = int(annotation_index)
-            categories.append(category)
-            annotation_indexes.append(annotation_index)
+    for category, annotation_index in SUBLABEL_PATTERN.findall(complex_label):
+        # Intern so every annotation with the same category shares one string
+        categories.append(sys.intern(category))
+        annotation_indexes.append(int(annotation_index) if annotation_index else -1)
     return categories, annotation_indexes
 
 
+def process_token_row(row: list, token_id: int,
+                      index_offset: int) -> Tuple[Token, int]:
+    """Parses one token row into a `Token`.
+
+    Args:
+        row: A token row from INCEpTION's TSV export format, already split
+          on tabs.
+        token_id: The position of the token in its sentence.
+        index_offset: The sentence's annotation index offset, or None if no
+          indexed annotation has been seen yet.
+
+    Returns:
+        The `Token` and the (possibly newly established) index offset.
+    """
+    text = row[2]  # Column 3 is annotation notes, which we don't need
+    complex_label = row[4]
+    if complex_label == "_":  # Token with no annotations
+        return Token(text=text, id=token_id), index_offset
+    if "*" in complex_label:  # Token no category (ignore these, but warn)
+        # I think these are tokens that didn't get annotated with a category, but do have a note
+        print(f"Warning: token '{text}' has label {complex_label} and note: {row[3]}")
+        return Token(text=text, id=token_id), index_offset
+
+    categories, annotation_ids = split_complex_label(complex_label)
+    if index_offset is None and annotation_ids[0] != -1:
+        index_offset = annotation_ids[0]
+    for j, annotation_id in enumerate(annotation_ids):
+        if annotation_id == -1:
+            continue
+        else:
+            annotation_ids[j] = annotation_id - index_offset
+
+    annotations = []
+    for category, annotation_id in zip(categories, annotation_ids):
+        annotations.append(TokenAnnotation(category=category,
+                                           id=annotation_id))
+    return Token(text=text, id=token_id, annotations=annotations), index_offset
+
+
+def find_index_offset(tsv_rows: list) -> int:
+    """Returns a sentence's annotation index offset.
+
+    The offset is the index of the first indexed annotation in the sentence,
+    or None if the sentence has no indexed annotations. Starred labels are
+    skipped, mirroring process_token_row, so their indexes never set the
+    offset.
+    """
+    for row in tsv_rows:
+        complex_label = row[4]
+        if "*" in complex_label:
+            continue
+        match = INDEX_PATTERN.search(complex_label)
+        if match:
+            return int(match.group(1))
+    return None
+
+
 def process_sentence(tsv_rows: list) -> Sentence:
     """Parses TSV rows representing tokens into a `Sentence`.
 
     Args:
-        tsv_rows: a list of tab-separated strings read from INCEpTION's TSV
-          export format.
+        tsv_rows: a list of token rows from INCEpTION's TSV export format,
+          each already split on tabs.
 
     Returns:
         A `Sentence`.
     """
-    sentence = Sentence()
-    index_offset = None
-    for i, row_string in enumerate(tsv_rows):
-        row = row_string.split("\t")
-        sentence.id = row[0][:row[0].index("-")]
-        text = row[2]  # Column 3 is annotation notes, which we don't need
-        complex_label = row[4]
-        if complex_label == "_":  # Token with no annotations
-            sentence.append(Token(text=text, id=i))
-        elif "*" in complex_label:  # Token no category (ignore these, but warn)
-            # I think these are tokens that didn't get annotated with a category, but do have a note
-            print(f"Warning: token '{text}' has label {complex_label} and note: {row[3]}")
-            sentence.append(Token(text=text, id=i))
-        else:
-            categories, annotation_ids = split_complex_label(complex_label)
-            if index_offset is None and annotation_ids[0] != -1:
-                index_offset = annotation_ids[0]
-            for j, annotation_id in enumerate(annotation_ids):
-                if annotation_id == -1:
-                    continue
-                else:
-                    annotation_ids[j] = annotation_id - index_offset
-
-            annotations = []
-            for category, annotation_id in zip(categories, annotation_ids):
-                annotations.append(TokenAnnotation(category=category,
-                                                   id=annotation_id))
-            sentence.append(Token(text=text,
-                                  id=i,
-                                  annotations=annotations))
+    # The token count is known up front, so fill a preallocated list
+    # instead of growing one append by append
+    tokens = [None] * len(tsv_rows)
+    sentence = Sentence(tokens=tokens)
+    index_offset = find_index_offset(tsv_rows)
+    for i, row in enumerate(tsv_rows):
+        sentence.id = row[0].partition("-")[0]
+        tokens[i], index_offset = process_token_row(row, i, index_offset)
     return sentence
 
 
 def process_opinion_file(opinion_path: Path, name: int) -> Document:
     """Parses a TSV export from INCEpTION and returns a document."""
 
-    with opinion_path.open("r", encoding="utf-8") as f:
-        data = f.readlines()
-
-    # Make sure sentences start in expected place
-    assert data[4].startswith("#Text")
-
     opinion = Document(name=name)
-    sentence_rows = []
+    sentence = Sentence()
+    index_offset = None
     sentence_id = 0
-    for row in data[4:]:
-        # This indicates the start of a new sentence,
-        # but we don't need to do anything with this line
-        if row.startswith("#Text"):
-            sentence_rows = []  # Reset sentence rows
-
-        # End of sentence reached
-        elif row == "\n":
-            sentence = process_sentence(sentence_rows)
-            sentence.id = sentence_id
-            opinion.append(sentence)
-            sentence_id += 1
-
-        # Token row
-        else:
-            sentence_rows.append(row)
+    with opinion_path.open("r", encoding="utf-8") as f:
+        # Skip the header lines
+        for _ in range(4):
+            next(f)
+
+        # Make sure sentences start in expected place
+        assert next(f).startswith("#Text")
+
+        for row in f:
+            # This indicates the start of a new sentence
+            if row.startswith("#Text"):
+                sentence = Sentence()
+                index_offset = None
+
+            # End of sentence reached
+            elif row == "\n":
+                sentence.id = sentence_id
+                opinion.append(sentence)
+                sentence_id += 1
+
+            # Unannotated token row: the label column is the last field
+            # before the tab-newline terminator, so a suffix check skips
+            # label parsing entirely for the common case
+            elif row.endswith("\t_\t\n"):
+                sentence.append(Token(text=row.split("\t", 3)[2],
+                                      id=len(sentence)))
+
+            # Annotated token row; parse it straight into the growing
+            # sentence. Only columns 0-4 are used, so don't split past them.
+            else:
+                token, index_offset = process_token_row(row.split("\t", 5),
+                                                        len(sentence),
+                                                        index_offset)
+                sentence.append(token)
 
     return opinion
+
+
+def process_opinion_files(opinion_paths: list, names: list = None,
+                          max_workers: int = None) -> list[Document]:
+    """Parses multiple TSV exports from INCEpTION in parallel.
+
+    One worker process handles one file; a single file's sentences parse
+    too quickly to be worth splitting further.
+
+    Args:
+        opinion_paths: Paths of the TSV exports to parse.
+        names: A name for each document. Defaults to each path's filename.
+        max_workers: Passed through to `ProcessPoolExecutor`.
+
+    Returns:
+        A list of `Document`s in the same order as `opinion_paths`.
+    """
+    if names is None:
+        names = [opinion_path.name for opinion_path in opinion_paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(process_opinion_file, opinion_paths, names))